@@ -74,6 +74,8 @@ REMOVED_EXPRESSIONS = [
     "\\dots",
 ]
 
+ANSWER_PATTERN = re.compile(r"(?i)Answer\s*:\s*([^\n]+)")
+
 
 def normalize_final_answer(final_answer: str) -> str:
     """Normalize a final answer to a quantitative reasoning question.
@@ -117,7 +119,7 @@ def normalize_final_answer(final_answer: str) -> str:
 
 
 def accuracy_reward(response: str, ground_truth: str) -> float:
-    match = re.findall(r"(?i)Answer\s*:\s*([^\n]+)", response)
+    match = ANSWER_PATTERN.findall(response) if ":" in response else None
     answer = match[-1] if match else "[INVALID]"
     if normalize_final_answer(answer) == normalize_final_answer(ground_truth):
         return 1.0
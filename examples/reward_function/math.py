@@ -18,9 +18,15 @@ from typing import Any
 from mathruler.grader import extract_boxed_content, grade_answer
 
 
+FORMAT_PATTERN = re.compile(r"<think>.*</think>.*\\boxed\{.*\}.*", re.DOTALL)
+TAG_SPACE_PATTERN = re.compile(r"\s*(<|>|/)\s*")
+
+
 def format_reward(response: str) -> float:
-    pattern = re.compile(r"<think>.*</think>.*\\boxed\{.*\}.*", re.DOTALL)
-    format_match = re.fullmatch(pattern, response)
+    if not response.startswith("<think>") or "\\boxed{" not in response:  # cheap check before regex
+        return 0.0
+
+    format_match = FORMAT_PATTERN.fullmatch(response)
     return 1.0 if format_match else 0.0
 
 
@@ -35,7 +41,7 @@ def compute_score(reward_inputs: list[dict[str, Any]], format_weight: float = 0.
 
     scores = []
     for reward_input in reward_inputs:
-        response = re.sub(r"\s*(<|>|/)\s*", r"\1", reward_input["response"])  # handle qwen2.5vl-32b format
+        response = TAG_SPACE_PATTERN.sub(r"\1", reward_input["response"])  # handle qwen2.5vl-32b format
         format_score = format_reward(response)
         accuracy_score = accuracy_reward(response, reward_input["ground_truth"])
         scores.append(
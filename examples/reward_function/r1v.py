@@ -18,16 +18,31 @@ from typing import Any
 from mathruler.grader import grade_answer
 
 
+FORMAT_PATTERN = re.compile(r"<think>.*?</think>\s*<answer>.*?</answer>", re.DOTALL)
+ANSWER_PATTERN = re.compile(r"<answer>(.*?)</answer>")
+
+
 def format_reward(response: str) -> float:
-    pattern = re.compile(r"<think>.*?</think>\s*<answer>.*?</answer>", re.DOTALL)
-    format_match = re.fullmatch(pattern, response)
+    if not response.startswith("<think>") or not response.endswith("</answer>"):  # cheap check before regex
+        return 0.0
+
+    format_match = FORMAT_PATTERN.fullmatch(response)
     return 1.0 if format_match else 0.0
 
 
+def extract_answer(response: str) -> str:
+    _, start_tag, rest = response.partition("<answer>")
+    content, end_tag, _ = rest.partition("</answer>")
+    if start_tag and end_tag and "\n" not in content:  # same result as ANSWER_PATTERN.search
+        return content.strip()
+
+    content_match = ANSWER_PATTERN.search(response) if start_tag else None
+    return content_match.group(1).strip() if content_match else response.strip()
+
+
 def accuracy_reward(response: str, ground_truth: str) -> float:
     try:
-        content_match = re.search(r"<answer>(.*?)</answer>", response)
-        given_answer = content_match.group(1).strip() if content_match else response.strip()
+        given_answer = extract_answer(response)
         if grade_answer(given_answer, ground_truth.strip()):
             return 1.0
 
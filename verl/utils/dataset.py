@@ -129,7 +129,10 @@ class RLHFDataset(Dataset):
 
         if os.path.isdir(data_path):
             # when we use dataset builder, we should always refer to the train split
-            file_type = os.path.splitext(os.listdir(data_path)[0])[-1][1:].replace("jsonl", "json")
+            with os.scandir(data_path) as entries:  # only the first entry is needed, avoid listing all shards
+                file_name = next(entries).name
+
+            file_type = os.path.splitext(file_name)[-1][1:].replace("jsonl", "json")
             self.dataset = load_dataset(file_type, data_dir=data_path, split=data_split)
         elif os.path.isfile(data_path):
             file_type = os.path.splitext(data_path)[-1][1:].replace("jsonl", "json")